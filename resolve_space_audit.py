@@ -19,6 +19,10 @@ Usage examples:
   # Show top 30 largest files under the root
   python resolve_space_audit.py "D:\Videos" --top 30
 
+  # Re-audit the same drive quickly: folders whose modified time hasn't changed since the
+  # last run are read from the cache instead of being rescanned
+  python resolve_space_audit.py "D:\Videos" --cache out/audit.sqlite
+
   # List only Resolve categories (size by category + paths), no deletion
   python resolve_space_audit.py "D:\Videos" --categories-only
 
@@ -35,12 +39,32 @@ Recommended workflow:
 """
 
 from pathlib import Path      # path handling (safer than raw strings)
-import os                     # os.walk to traverse directories
+import os                     # os.scandir to traverse directories
+import re                     # precompiled category matcher
+import sys                    # sys.intern for extension strings, platform checks
+import stat                   # file type checks (native Windows listings, cached subdirectories)
 import argparse               # parse command-line flags/options
 import json                   # write JSON report
+import sqlite3                # optional on-disk scan cache (--cache)
 import csv                    # write CSV report
+from collections import Counter  # per-extension byte totals
+from itertools import chain, groupby, islice  # group / batch deletions
+from functools import lru_cache  # memoize human() for repeated byte counts
+import heapq                  # bounded min-heap for the top-N largest files
+import tempfile               # per-category spool files for deletion candidates
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED  # parallel scans/deletes
 from datetime import datetime, timedelta # timestamps for "generated_at" and age filters
 
+try:
+    import orjson             # optional: much faster JSON report writing
+except ImportError:
+    orjson = None
+
+try:
+    from send2trash import send2trash  # optional: --trash moves files to the recycle bin
+except ImportError:
+    send2trash = None
+
 # Heuristics / common Resolve folder names (customize if yours differ)
 CATEGORY_PATTERNS = {
     "proxy": ["Proxy", "ProxyMedia", "Proxies"],
@@ -50,12 +74,26 @@ CATEGORY_PATTERNS = {
     "backups": ["Backups", "Project Backups", "Resolve Backups"],
 }
 
+# Lowercased lookup tables derived from CATEGORY_PATTERNS (don't edit these directly).
+# When a path matches several categories, the one listed first above wins.
+_CATEGORY_RANK = {cat: i for i, cat in enumerate(CATEGORY_PATTERNS)}
+_NEEDLE_CATEGORY = {n.lower(): cat for cat, ns in reversed(CATEGORY_PATTERNS.items()) for n in ns}
+# One alternation over every needle, anchored to whole path segments, so a single
+# regex pass over the lowercased dirpath finds every category folder in it
+_SEPS = re.escape(os.sep + (os.altsep or ""))
+_CATEGORY_RE = re.compile(
+    rf"(?:^|[{_SEPS}])("
+    + "|".join(re.escape(n) for n in sorted(_NEEDLE_CATEGORY, key=len, reverse=True))
+    + rf")(?=[{_SEPS}]|$)"
+)
+
 # File extensions that are often large/temporary-ish (customize)
 LARGE_EXTS = [
     ".mov", ".mp4", ".mxf", ".braw", ".dng", ".wav", ".caf", ".flac", ".dvcc", ".dpx",
     ".exr", ".tif", ".tiff", ".prores", ".r3d", ".mkv"
 ]
 
+@lru_cache(maxsize=4096)
 def human(n: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
     s = 0
@@ -65,60 +103,425 @@ def human(n: int) -> str:
         s += 1
     return f"{f:.2f} {units[s]}"
 
-def walk_files(root: Path):
-    for dirpath, dirnames, filenames in os.walk(root):
-        # skip system or hidden dirs heuristically
-        # (customize if needed)
-        for name in filenames:
-            p = Path(dirpath) / name
+def default_workers() -> int:
+    # scanning is I/O-bound and scandir/stat release the GIL, so oversubscribe the CPUs
+    return min(32, (os.cpu_count() or 1) * 2)
+
+def _scan_dir(dirpath: str, follow_symlinks: bool = False, stat_dirs: bool = False):
+    # os.scandir hands back DirEntry objects that already carry the file type (and, on
+    # Windows, the size/mtime), so each file costs at most one stat call.
+    # Symlinks are counted but not followed unless asked: following them can mean slow
+    # remote resolves on mapped drives and double-counting linked media trees.
+    # Subdirectories come back as (path, stat_result or None, is_symlink); they are only
+    # statted when stat_dirs is set. "complete" is False if anything couldn't be read.
+    files = []
+    subdirs = []
+    symlinks = 0
+    complete = True
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_link = entry.is_symlink()
+                    if is_link:
+                        symlinks += 1
+                        if not follow_symlinks:
+                            continue
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        # a real stat, not entry.stat(): on Windows the latter comes from
+                        # the find data, which has no st_ino/st_dev and can lag behind
+                        st = os.stat(entry.path, follow_symlinks=follow_symlinks) if stat_dirs else None
+                        subdirs.append((entry.path, st, is_link))
+                        continue
+                    if not entry.is_file(follow_symlinks=follow_symlinks):
+                        # FIFOs, sockets, devices, dangling links: answered from the
+                        # directory listing itself, no stat needed to skip them
+                        continue
+                    st = entry.stat(follow_symlinks=follow_symlinks)
+                except (PermissionError, FileNotFoundError):
+                    complete = False
+                    continue
+                files.append((entry.name, st.st_size, st.st_mtime))
+    except OSError:
+        # unreadable or vanished directory: skip it like os.walk does
+        complete = False
+    return dirpath, files, subdirs, symlinks, complete
+
+# Windows only: FindFirstFileExW with FIND_FIRST_EX_LARGE_FETCH asks the kernel for bigger
+# directory batches per call, which cuts round-trips on folders holding thousands of clips
+# (Proxy, OptimizedMedia, CacheClip). Sizes and timestamps come straight from the find data.
+_FILE_ATTRIBUTE_DIRECTORY = 0x10
+_FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+_IO_REPARSE_TAG_SYMLINK = 0xA000000C
+_FIND_EX_INFO_BASIC = 1
+_FIND_EX_SEARCH_NAME_MATCH = 0
+_FIND_FIRST_EX_LARGE_FETCH = 2
+_ERROR_NO_MORE_FILES = 18
+
+@lru_cache(maxsize=None)
+def _win_find_api():
+    import ctypes
+    from ctypes import wintypes
+    k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    find_first = k32.FindFirstFileExW
+    find_first.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                           ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    find_first.restype = wintypes.HANDLE
+    find_next = k32.FindNextFileW
+    find_next.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    find_next.restype = wintypes.BOOL
+    find_close = k32.FindClose
+    find_close.argtypes = [wintypes.HANDLE]
+    find_close.restype = wintypes.BOOL
+    return ctypes, wintypes.WIN32_FIND_DATAW, find_first, find_next, find_close
+
+def _filetime(ft) -> float:
+    # FILETIME (100ns ticks since 1601) -> Unix timestamp, rounded the same way os.stat does
+    ticks = (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+    sec, rem = divmod(ticks, 10_000_000)
+    return (sec - 11644473600) + rem * 100 * 1e-9
+
+def _win_scandir(dirpath: str):
+    # Yields (name, attributes, reparse_tag, size, mtime) for every entry but "." and ".."
+    ctypes, FIND_DATA, find_first, find_next, find_close = _win_find_api()
+    data = FIND_DATA()
+    handle = find_first(os.path.join(dirpath, "*"), _FIND_EX_INFO_BASIC, ctypes.byref(data),
+                        _FIND_EX_SEARCH_NAME_MATCH, None, _FIND_FIRST_EX_LARGE_FETCH)
+    if handle is None or handle == ctypes.c_void_p(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        while True:
+            name = data.cFileName
+            if name not in (".", ".."):
+                yield (name, data.dwFileAttributes, data.dwReserved0,
+                       (data.nFileSizeHigh << 32) | data.nFileSizeLow, _filetime(data.ftLastWriteTime))
+            if not find_next(handle, ctypes.byref(data)):
+                err = ctypes.get_last_error()
+                if err != _ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(err)
+                return
+    finally:
+        find_close(handle)
+
+def _scan_dir_win(dirpath: str, follow_symlinks: bool = False, stat_dirs: bool = False):
+    # Same contract as _scan_dir, but listing with _win_scandir
+    files = []
+    subdirs = []
+    symlinks = 0
+    complete = True
+    try:
+        for name, attrs, tag, size, mtime in _win_scandir(dirpath):
+            path = os.path.join(dirpath, name)
             try:
-                size = p.stat().st_size
-                mtime = p.stat().st_mtime
+                if attrs & _FILE_ATTRIBUTE_REPARSE_POINT and tag == _IO_REPARSE_TAG_SYMLINK:
+                    symlinks += 1
+                    if not follow_symlinks:
+                        continue
+                    # the find data describes the link itself; look at its target
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue  # dangling link
+                    if stat.S_ISDIR(st.st_mode):
+                        subdirs.append((path, st if stat_dirs else None, True))
+                    elif stat.S_ISREG(st.st_mode):
+                        files.append((name, st.st_size, st.st_mtime))
+                    continue
+                if attrs & _FILE_ATTRIBUTE_DIRECTORY:
+                    subdirs.append((path, os.stat(path, follow_symlinks=False) if stat_dirs else None, False))
+                    continue
             except (PermissionError, FileNotFoundError):
+                complete = False
                 continue
-            yield p, size, mtime
-
-def classify_category(path: Path) -> str | None:
-    parts = [p.lower() for p in path.parts]
-    for cat, needles in CATEGORY_PATTERNS.items():
-        for n in needles:
-            if n.lower() in parts:
-                return cat
-    return None
+            files.append((name, size, mtime))
+    except OSError:
+        # unreadable or vanished directory: skip it like os.walk does
+        complete = False
+    return dirpath, files, subdirs, symlinks, complete
+
+def _restat_dir(dirpath: str, files: list, subdir_paths: list, symlinks: int,
+                follow_symlinks: bool = False):
+    # Directory unchanged since the cached scan: its listing comes from the cache, but
+    # the subdirectories still need a fresh stat to check their own mtimes.
+    subdirs = []
+    for path in subdir_paths:
+        try:
+            st = os.stat(path, follow_symlinks=False)
+            is_link = stat.S_ISLNK(st.st_mode)
+            if is_link and follow_symlinks:
+                st = os.stat(path)
+        except OSError:
+            continue
+        subdirs.append((path, st, is_link))
+    return dirpath, files, subdirs, symlinks, True
+
+# bump when the cache's row format changes, so old caches are rebuilt instead of misread
+_CACHE_FORMAT = "1"
+
+def open_cache(cache_path: str, follow_symlinks: bool = False) -> sqlite3.Connection:
+    # One row per directory (keyed by path, with its mtime at scan time) plus its files.
+    # Adding/removing entries bumps a directory's mtime, so an unchanged mtime means the
+    # cached listing can be reused without calling scandir.
+    # Paths and names are stored as bytes (os.fsencode), so filenames that aren't valid
+    # UTF-8 round-trip exactly instead of failing to encode.
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS dirs (path BLOB PRIMARY KEY, parent BLOB, mtime REAL, symlinks INTEGER);
+        CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+        CREATE TABLE IF NOT EXISTS files (dir BLOB, name BLOB, size INTEGER, mtime REAL, PRIMARY KEY (dir, name));
+    """)
+    # listings made with and without --follow-symlinks differ; don't mix them
+    mode = f"{_CACHE_FORMAT}:{'follow' if follow_symlinks else 'nofollow'}"
+    row = conn.execute("SELECT value FROM meta WHERE key = 'mode'").fetchone()
+    if row is None or row[0] != mode:
+        conn.execute("DELETE FROM dirs")
+        conn.execute("DELETE FROM files")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('mode', ?)", (mode,))
+        conn.commit()
+    return conn
+
+def _cache_lookup(conn: sqlite3.Connection, dirpath: str, mtime: float):
+    key = os.fsencode(dirpath)
+    row = conn.execute("SELECT mtime, symlinks FROM dirs WHERE path = ?", (key,)).fetchone()
+    if row is None or row[0] != mtime:
+        return None
+    files = [(os.fsdecode(name), size, fmtime)
+             for name, size, fmtime in conn.execute("SELECT name, size, mtime FROM files WHERE dir = ?", (key,))]
+    subdirs = [os.fsdecode(r[0]) for r in conn.execute("SELECT path FROM dirs WHERE parent = ?", (key,))]
+    return files, subdirs, row[1]
+
+def _cache_forget(conn: sqlite3.Connection, key: bytes):
+    # drop a directory (by encoded path) and everything below it
+    lo = key + os.fsencode(os.sep)
+    hi = key + bytes([ord(os.sep) + 1])
+    conn.execute("DELETE FROM dirs WHERE path = ? OR (path > ? AND path < ?)", (key, lo, hi))
+    conn.execute("DELETE FROM files WHERE dir = ? OR (dir > ? AND dir < ?)", (key, lo, hi))
+
+def _cache_store(conn: sqlite3.Connection, dirpath: str, mtime: float, files: list,
+                 subdirs: list, symlinks: int):
+    key = os.fsencode(dirpath)
+    conn.execute("DELETE FROM files WHERE dir = ?", (key,))
+    conn.executemany("INSERT INTO files (dir, name, size, mtime) VALUES (?, ?, ?, ?)",
+                     ((key, os.fsencode(name), size, fmtime) for name, size, fmtime in files))
+    conn.execute(
+        "INSERT INTO dirs (path, parent, mtime, symlinks) VALUES (?, NULL, ?, ?) "
+        "ON CONFLICT (path) DO UPDATE SET mtime = excluded.mtime, symlinks = excluded.symlinks",
+        (key, mtime, symlinks))
+    current = {os.fsencode(path) for path, _, _ in subdirs}
+    for (old,) in conn.execute("SELECT path FROM dirs WHERE parent = ?", (key,)).fetchall():
+        if old not in current:
+            _cache_forget(conn, old)
+    # placeholder rows (mtime NULL never matches) so the subdirectory list is complete
+    # even if this run stops before they are scanned themselves. A subdirectory may
+    # already be cached from an earlier run that used it as the scan root (parent NULL),
+    # so always (re)link it to this directory.
+    conn.executemany("INSERT INTO dirs (path, parent, mtime, symlinks) VALUES (?, ?, NULL, 0) "
+                     "ON CONFLICT (path) DO UPDATE SET parent = excluded.parent",
+                     ((path, key) for path in current))
+
+def walk_dirs(root: Path, workers: int | None = None, follow_symlinks: bool = False,
+              counts: dict | None = None, cache: sqlite3.Connection | None = None,
+              large_fetch: bool = False):
+    # Directories are scanned concurrently on a thread pool; results are handed back to
+    # the calling thread, so callers aggregate (and touch the cache) without any locking.
+    # Yields (dirpath, [(name, size, mtime), ...]) once per directory, so the per-file
+    # loop runs in the caller without a generator round-trip per file.
+    # If counts is given, counts["symlinks"] is bumped for every symlink seen.
+    root = os.fspath(root)
+    scan_dir = _scan_dir_win if large_fetch and sys.platform == "win32" else _scan_dir
+    stat_dirs = follow_symlinks or cache is not None
+    visited = set()
+    root_st = os.stat(root) if stat_dirs else None
+    with ThreadPoolExecutor(max_workers=workers or default_workers()) as ex:
+        pending = {}  # future -> mtime to store in the cache once scanned (or None)
+
+        def submit(path, st):
+            if cache is not None:
+                hit = _cache_lookup(cache, path, st.st_mtime)
+                if hit is not None:
+                    pending[ex.submit(_restat_dir, path, *hit, follow_symlinks)] = None
+                    return
+                pending[ex.submit(scan_dir, path, follow_symlinks, stat_dirs)] = st.st_mtime
+            else:
+                pending[ex.submit(scan_dir, path, follow_symlinks, stat_dirs)] = None
+
+        submit(root, root_st)
+        if follow_symlinks:
+            visited.add((root_st.st_dev, root_st.st_ino))
+        # Symlinked subdirectories wait until everything reachable without a link has been
+        # scanned, so a folder that is also linked from elsewhere (e.g. a shortcut to
+        # Project/Proxy) is reported, and categorized, under its real path.
+        deferred = []
+        try:
+            while pending or deferred:
+                if not pending:
+                    for d, st in deferred:
+                        key = (st.st_dev, st.st_ino)
+                        if key not in visited:
+                            visited.add(key)
+                            submit(d, st)
+                    deferred = []
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    store_mtime = pending.pop(fut)
+                    dirpath, files, subdirs, symlinks, complete = fut.result()
+                    if store_mtime is not None and complete:
+                        _cache_store(cache, dirpath, store_mtime, files, subdirs, symlinks)
+                    if counts is not None:
+                        counts["symlinks"] = counts.get("symlinks", 0) + symlinks
+                    for d, st, is_link in subdirs:
+                        # when following links, remember which directory this really is
+                        # so loops and trees linked twice are only scanned once
+                        if follow_symlinks:
+                            if is_link:
+                                deferred.append((d, st))
+                                continue
+                            key = (st.st_dev, st.st_ino)
+                            if key in visited:
+                                continue
+                            visited.add(key)
+                        submit(d, st)
+                    yield dirpath, files
+        finally:
+            # caller stopped early: don't start scans nobody will read
+            for fut in pending:
+                fut.cancel()
+            if cache is not None:
+                cache.commit()
+
+def walk_files(root: Path, workers: int | None = None, follow_symlinks: bool = False,
+               counts: dict | None = None, cache: sqlite3.Connection | None = None,
+               large_fetch: bool = False):
+    # Flat (dirpath, name, size, mtime) view of walk_dirs
+    for dirpath, files in walk_dirs(root, workers, follow_symlinks, counts, cache, large_fetch):
+        for name, size, mtime in files:
+            yield dirpath, name, size, mtime
+
+def file_ext(name: str) -> str:
+    # same rules as Path.suffix (".bashrc" and "clip." have no extension), minus the Path.
+    # There are only a few dozen distinct extensions, so intern them: dict keys and
+    # comparisons then hit the identity fast path instead of comparing characters.
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return sys.intern(name[i:].lower())
+    return ""
+
+def better_category(a: str | None, b: str | None) -> str | None:
+    # when a path matches several categories, the one listed first in CATEGORY_PATTERNS wins
+    if a is None or (b is not None and _CATEGORY_RANK[b] < _CATEGORY_RANK[a]):
+        return b
+    return a
+
+def classify_category(dirpath: str) -> str | None:
+    best = None
+    for m in _CATEGORY_RE.finditer(dirpath.lower()):
+        best = better_category(best, _NEEDLE_CATEGORY[m.group(1)])
+    return best
+
+def open_spools(categories) -> dict:
+    # One temp file per category. Each record is "size<TAB>mtime<TAB>path" terminated by
+    # NUL: filenames may contain newlines and tabs, but never NUL, so a record can't be
+    # split (or forged) by a crafted name.
+    spools = {}
+    for k in categories:
+        spools[k] = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", errors="surrogateescape", newline="",
+            prefix=f"resolve_audit_{k}_", suffix=".spool", delete=False)
+    return spools
+
+def read_spool(spool_path: str):
+    with open(spool_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        tail = ""
+        while chunk := f.read(1 << 20):
+            records = (tail + chunk).split("\0")
+            tail = records.pop()  # incomplete record at the end of this chunk (or "")
+            for record in records:
+                size, mtime, path = record.split("\t", 2)
+                yield {"path": path, "size": int(size), "mtime": float(mtime)}
+
+def remove_spools(stats: dict):
+    for spool_path in stats.get("by_category_spool", {}).values():
+        try:
+            os.remove(spool_path)
+        except FileNotFoundError:
+            pass
 
-def collect_stats(root: Path, top_n: int = 30):
+def collect_stats(root: Path, top_n: int = 30, workers: int | None = None, follow_symlinks: bool = False,
+                  cache: sqlite3.Connection | None = None, large_fetch: bool = False,
+                  spool_categories=None):
     total_bytes = 0
-    by_ext = {}
+    by_ext = Counter()
     largest = []
     by_category_bytes = {"proxy": 0, "optimized": 0, "render_cache": 0, "stills": 0, "backups": 0, "other": 0}
-    by_category_paths = {k: [] for k in by_category_bytes.keys()}
+    by_category_files = {k: 0 for k in by_category_bytes.keys()}
 
     now = datetime.now().timestamp()
 
-    for p, size, mtime in walk_files(root):
-        total_bytes += size
-        ext = p.suffix.lower()
-        by_ext[ext] = by_ext.get(ext, 0) + size
-
-        cat = classify_category(p)
-        if cat is None:
-            cat = "other"
-
-        by_category_bytes[cat] += size
-        by_category_paths[cat].append({"path": str(p), "size": size, "mtime": mtime})
-
-        # maintain largest list (top_n)
-        largest.append((size, str(p)))
-        if len(largest) > top_n * 3:
-            largest.sort(reverse=True)
-            largest = largest[:top_n]
+    # Every scanned path is only needed again for the JSON report or a --delete-category
+    # run, so spool those categories to disk instead of keeping a dict per file in RAM.
+    # spool_categories=None spools all of them.
+    if spool_categories is None:
+        spool_categories = by_category_bytes.keys()
+    spools = open_spools(spool_categories)
+    spool_paths = {k: f.name for k, f in spools.items()}
+
+    counts = {"symlinks": 0}
+
+    # Category only depends on the directory. Parents are always yielded before their
+    # children, so a directory's category is its parent's combined with a dict lookup
+    # of its own name; only the root needs a full classify_category pass.
+    dir_cat_cache: dict[str, str | None] = {}
+    heappush = heapq.heappush
+    heappushpop = heapq.heappushpop
+    try:
+        for dirpath, files in walk_dirs(root, workers, follow_symlinks, counts, cache, large_fetch):
+            parent, base = os.path.split(dirpath)
+            if parent in dir_cat_cache:
+                cat = better_category(dir_cat_cache[parent], _NEEDLE_CATEGORY.get(base.lower()))
+            else:
+                cat = classify_category(dirpath)
+            dir_cat_cache[dirpath] = cat
+            if not files:
+                continue
+            cat = cat or "other"
+
+            # hot loop: everything per-directory is hoisted out, lookups bound to locals
+            prefix = os.path.join(dirpath, "")
+            spool = spools.get(cat)
+            spool_write = spool.write if spool is not None else None
+            dir_bytes = 0
+            for name, size, mtime in files:
+                path = prefix + name
+                dir_bytes += size
+                by_ext[file_ext(name)] += size
+                if spool_write is not None:
+                    spool_write(f"{size}\t{mtime}\t{path}\0")
+
+                # maintain largest list (top_n): min-heap, so largest[0] is the smallest kept file
+                if len(largest) < top_n:
+                    heappush(largest, (size, path))
+                elif largest and size >= largest[0][0]:
+                    heappushpop(largest, (size, path))
+
+            total_bytes += dir_bytes
+            by_category_bytes[cat] += dir_bytes
+            by_category_files[cat] += len(files)
+    except BaseException:
+        for f in spools.values():
+            f.close()
+        remove_spools({"by_category_spool": spool_paths})
+        raise
+    for f in spools.values():
+        f.close()
 
     # finalize largest
     largest.sort(reverse=True)
-    largest = largest[:top_n]
 
     # ext stats sorted
-    by_ext_sorted = sorted(by_ext.items(), key=lambda kv: kv[1], reverse=True)
+    by_ext_sorted = by_ext.most_common()
 
     return {
         "root": str(root),
@@ -127,25 +530,62 @@ def collect_stats(root: Path, top_n: int = 30):
         "by_ext": [{"ext": k, "bytes": v, "human": human(v)} for k, v in by_ext_sorted],
         "largest_files": [{"path": p, "bytes": s, "human": human(s)} for s, p in largest],
         "by_category_bytes": {k: {"bytes": v, "human": human(v)} for k, v in by_category_bytes.items()},
-        "by_category_paths": by_category_paths,
+        "by_category_files": by_category_files,
+        # temp files holding every path per spooled category; write_report turns these
+        # into "by_category_paths"
+        "by_category_spool": spool_paths,
+        "skipped_symlinks": 0 if follow_symlinks else counts["symlinks"],
         "generated_at": datetime.now().isoformat(timespec="seconds")
     }
 
+def _to_json(value, indent: bool = False) -> str:
+    # orjson when available; the stdlib encoder otherwise, and for anything orjson
+    # refuses (e.g. undecodable filenames, which json escapes)
+    if orjson is not None:
+        try:
+            text = orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+        except orjson.JSONEncodeError:
+            text = None
+        if text is not None:
+            return text.replace("\n", "\n  ") if indent else text
+    if indent:
+        return json.dumps(value, indent=2).replace("\n", "\n  ")
+    return json.dumps(value)
+
 def write_report(report_base: Path, stats: dict):
     report_base.parent.mkdir(parents=True, exist_ok=True)
     json_path = report_base.with_suffix(".json")
     csv_path = report_base.with_suffix(".csv")
 
-    # JSON
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2)
+    # JSON, written piece by piece so the per-category path lists are streamed from the
+    # spool files instead of being loaded into memory
+    with open(json_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write("{")
+        sep = ""
+        for key, value in stats.items():
+            if key != "by_category_spool":
+                f.write(f"{sep}\n  {json.dumps(key)}: {_to_json(value, indent=True)}")
+            elif value:
+                f.write(f'{sep}\n  "by_category_paths": {{')
+                for i, (cat, spool_path) in enumerate(value.items()):
+                    f.write(f'{"," if i else ""}\n    {json.dumps(cat)}: [')
+                    item_sep = "\n      "
+                    for entry in read_spool(spool_path):
+                        f.write(item_sep + _to_json(entry))
+                        item_sep = ",\n      "
+                    f.write("]" if item_sep == "\n      " else "\n    ]")
+                f.write("\n  }")
+            else:
+                continue
+            sep = ","
+        f.write("\n}\n")
 
-    # CSV: largest files
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+    # CSV: largest files (1 MiB buffer so large lists don't cost a write call per few rows;
+    # undecodable filenames are written back as their original bytes)
+    with open(csv_path, "w", newline="", encoding="utf-8", errors="surrogateescape", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["path", "bytes", "human"])
-        for item in stats["largest_files"]:
-            w.writerow([item["path"], item["bytes"], item["human"]])
+        w.writerows((item["path"], item["bytes"], item["human"]) for item in stats["largest_files"])
 
     return str(json_path), str(csv_path)
 
@@ -153,41 +593,187 @@ def confirm(prompt: str) -> bool:
     ans = input(f"{prompt} [y/N]: ").strip().lower()
     return ans in ("y", "yes")
 
-def delete_category(paths: list[dict], min_age_days: int | None):
-    if min_age_days is not None:
-        cutoff = datetime.now().timestamp() - (min_age_days * 86400)
-        to_delete = [p for p in paths if p["mtime"] < cutoff]
+# unlink relative to an open parent directory handle (unlinkat) where the OS supports it
+_UNLINK_AT = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+# unlinks are I/O-bound and overlap well, except on NTFS where they serialize on the MFT
+DELETE_WORKERS = 4 if os.name == "nt" else 16
+# files unlinked per pool task (a task per file costs more than a local unlink), and
+# how many tasks may be in flight at once
+DELETE_BATCH = 64
+DELETE_WINDOW = DELETE_WORKERS * 2
+
+def _unlink(path: str, dfd: int | None):
+    if dfd is None:
+        os.remove(path)
     else:
-        to_delete = list(paths)
+        os.unlink(os.path.basename(path), dir_fd=dfd)
 
-    total = sum(p["size"] for p in to_delete)
-    print(f"About to delete {len(to_delete)} files, total {human(total)}")
-    if not confirm("Proceed with deletion?"):
-        print("Aborted.")
-        return 0, 0
+def _unlink_batch(batch: list) -> list:
+    # runs on a pool thread: unlinks every (entry, dfd) pair, returns the failures
+    failed = []
+    for entry, dfd in batch:
+        try:
+            _unlink(entry["path"], dfd)
+        except Exception as e:
+            failed.append((entry, e))
+    return failed
+
+def remove_files(entries) -> tuple[int, int]:
+    # Entries ({"path", "size"} dicts) arrive grouped by directory (scan order), so each
+    # directory is resolved once and every file in it is unlinked by bare name. Unlinks
+    # go to a thread pool in batches, with a bounded window of batches in flight across
+    # directory boundaries, so many small folders overlap as well as one big one.
+    deleted = 0
+    freed = 0
+    pending = {}  # future -> its batch
+    refs = {}     # open dfd -> queued unlinks using it (+1 while its directory is being queued)
+
+    def release(dfd):
+        refs[dfd] -= 1
+        if not refs[dfd]:
+            del refs[dfd]
+            os.close(dfd)
+
+    def settle(done):
+        nonlocal deleted, freed
+        for fut in done:
+            batch = pending.pop(fut)
+            failed = fut.result()
+            for entry, e in failed:
+                print(f"Failed to delete {entry['path']}: {e}")
+            deleted += len(batch) - len(failed)
+            freed += sum(entry["size"] for entry, _ in batch) - sum(entry["size"] for entry, _ in failed)
+            for _, dfd in batch:
+                if dfd is not None:
+                    release(dfd)
+
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as ex:
+
+        def flush(batch):
+            while len(pending) >= DELETE_WINDOW:
+                settle(wait(pending, return_when=FIRST_COMPLETED)[0])
+            pending[ex.submit(_unlink_batch, batch)] = batch
+
+        batch = []
+        try:
+            for dirname, group in groupby(entries, key=lambda e: os.path.dirname(e["path"])):
+                # a directory handle costs an open and a close, so it only pays off for 2+ files
+                head = list(islice(group, 2))
+                dfd = None
+                if _UNLINK_AT and dirname and len(head) > 1:
+                    try:
+                        dfd = os.open(dirname, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+                        refs[dfd] = 1
+                    except OSError:
+                        dfd = None  # fall back to full paths; failures get reported per file
+                try:
+                    for entry in chain(head, group):
+                        if dfd is not None:
+                            refs[dfd] += 1
+                        batch.append((entry, dfd))
+                        if len(batch) >= DELETE_BATCH:
+                            flush(batch)
+                            batch = []
+                finally:
+                    if dfd is not None:
+                        release(dfd)
+            if batch:
+                flush(batch)
+                batch = []
+            settle(wait(pending)[0])
+        finally:
+            # stopped early: let queued unlinks finish before closing the fds they use
+            for fut in pending:
+                fut.cancel()
+            wait(pending)
+            for dfd in refs:
+                os.close(dfd)
+    return deleted, freed
+
+# paths handed to the OS trash per call; the recycle bin APIs handle a batch as one operation
+TRASH_BATCH = 1000
 
+def trash_files(entries) -> tuple[int, int]:
+    # Like remove_files, but moves entries to the OS trash / recycle bin (reversible)
     deleted = 0
     freed = 0
-    for entry in to_delete:
+    it = iter(entries)
+    while batch := list(islice(it, TRASH_BATCH)):
+        # files that are already gone aren't ours to count
+        present = []
+        for entry in batch:
+            if os.path.lexists(entry["path"]):
+                present.append(entry)
+            else:
+                print(f"Failed to move {entry['path']} to trash: file no longer exists")
+        if not present:
+            continue
         try:
-            os.remove(entry["path"])
-            deleted += 1
-            freed += entry["size"]
-        except Exception as e:
-            print(f"Failed to delete {entry['path']}: {e}")
+            send2trash([entry["path"] for entry in present])
+            done = present
+        except Exception:
+            # the batch failed part-way: whatever existed just before the call and is gone
+            # now was moved by it; retry the rest one by one to find the problem files
+            done = []
+            for entry in present:
+                if not os.path.lexists(entry["path"]):
+                    done.append(entry)
+                    continue
+                try:
+                    send2trash(entry["path"])
+                    done.append(entry)
+                except Exception as e:
+                    print(f"Failed to move {entry['path']} to trash: {e}")
+        deleted += len(done)
+        freed += sum(entry["size"] for entry in done)
+    return deleted, freed
 
-    print(f"Deleted {deleted} files, freed {human(freed)}")
+def delete_category(spool_path: str, min_age_days: int | None, trash: bool = False):
+    # the spool is read twice (once to summarize, once to delete) rather than held in memory
+    cutoff = None
+    if min_age_days is not None:
+        cutoff = datetime.now().timestamp() - (min_age_days * 86400)
+
+    def to_delete():
+        for p in read_spool(spool_path):
+            if cutoff is None or p["mtime"] < cutoff:
+                yield p
+
+    count = 0
+    total = 0
+    for p in to_delete():
+        count += 1
+        total += p["size"]
+    if trash:
+        print(f"About to move {count} files to trash, total {human(total)}")
+    else:
+        print(f"About to delete {count} files, total {human(total)}")
+    if not confirm("Proceed with moving them to trash?" if trash else "Proceed with deletion?"):
+        print("Aborted.")
+        return 0, 0
+
+    if trash:
+        deleted, freed = trash_files(to_delete())
+        print(f"Moved {deleted} files to trash ({human(freed)}; space is freed when the trash is emptied)")
+    else:
+        deleted, freed = remove_files(to_delete())
+        print(f"Deleted {deleted} files, freed {human(freed)}")
     return deleted, freed
 
-def delete_by_ext(root: Path, ext: str, min_age_days: int | None):
+def delete_by_ext(root: Path, ext: str, min_age_days: int | None, workers: int | None = None,
+                  follow_symlinks: bool = False, cache: sqlite3.Connection | None = None,
+                  trash: bool = False, large_fetch: bool = False):
     ext = ext.lower()
     if not ext.startswith("."):
         ext = "." + ext
+    ext = sys.intern(ext)  # same object file_ext() returns for a match
 
     candidates = []
-    for p, size, mtime in walk_files(root):
-        if p.suffix.lower() == ext:
-            candidates.append({"path": str(p), "size": size, "mtime": mtime})
+    for dirpath, name, size, mtime in walk_files(root, workers, follow_symlinks, cache=cache,
+                                                 large_fetch=large_fetch):
+        if file_ext(name) == ext:
+            candidates.append({"path": os.path.join(dirpath, name), "size": size, "mtime": mtime})
 
     total = sum(c["size"] for c in candidates)
     print(f"Found {len(candidates)} files with extension {ext} totaling {human(total)}")
@@ -197,26 +783,19 @@ def delete_by_ext(root: Path, ext: str, min_age_days: int | None):
     if not candidates:
         return 0, 0
 
-    if not confirm("Proceed with deletion?"):
+    if not confirm("Proceed with moving them to trash?" if trash else "Proceed with deletion?"):
         print("Aborted.")
         return 0, 0
 
-    deleted = 0
-    freed = 0
-    from datetime import datetime
     cutoff = datetime.now().timestamp() - (min_age_days * 86400) if min_age_days else None
 
-    for c in candidates:
-        if cutoff and c["mtime"] >= cutoff:
-            continue
-        try:
-            os.remove(c["path"])
-            deleted += 1
-            freed += c["size"]
-        except Exception as e:
-            print(f"Failed to delete {c['path']}: {e}")
-
-    print(f"Deleted {deleted} files, freed {human(freed)}")
+    to_delete = (c for c in candidates if not (cutoff and c["mtime"] >= cutoff))
+    if trash:
+        deleted, freed = trash_files(to_delete)
+        print(f"Moved {deleted} files to trash ({human(freed)}; space is freed when the trash is emptied)")
+    else:
+        deleted, freed = remove_files(to_delete)
+        print(f"Deleted {deleted} files, freed {human(freed)}")
     return deleted, freed
 
 def main():
@@ -228,17 +807,55 @@ def main():
     ap.add_argument("--delete-category", choices=list(CATEGORY_PATTERNS.keys()), help="Delete files in a known category (proxy/optimized/render_cache/stills/backups)")
     ap.add_argument("--delete-ext", type=str, help="Delete files by extension (e.g., .dvcc)")
     ap.add_argument("--min-age-days", type=int, help="Only delete files older than N days (safety valve)")
+    ap.add_argument("--trash", action="store_true", help="Move files to the trash / recycle bin instead of deleting them (needs send2trash)")
+    ap.add_argument("--follow-symlinks", action="store_true", help="Follow symlinked files and folders (default: skip them)")
+    ap.add_argument("--workers", type=int, help="Directories to scan in parallel (default: 2x CPU count, max 32)")
+    ap.add_argument("--large-fetch", action="store_true", help="Windows only: list folders with FindFirstFileExW large-fetch "
+                                                                "batches instead of os.scandir (ignored elsewhere)")
+    ap.add_argument("--cache", type=str, help="SQLite file to keep scan results in; later runs skip folders whose "
+                                               "modified time hasn't changed (files rewritten in place may show stale sizes)")
 
     args = ap.parse_args()
+    if args.trash and send2trash is None:
+        ap.error("--trash needs the send2trash package (pip install send2trash)")
     root = Path(args.root).expanduser()
 
     if not root.exists():
         print(f"Root path does not exist: {root}")
         return 2
 
-    stats = collect_stats(root, top_n=args.top)
-
+    cache = None
+    if args.cache:
+        # cached folders are keyed by path, so make sure that doesn't depend on the cwd
+        root = Path(os.path.abspath(root))
+        try:
+            cache = open_cache(args.cache, args.follow_symlinks)
+        except (OSError, sqlite3.Error) as e:
+            ap.error(f"can't use cache file {args.cache}: {e}")
+
+    try:
+        # spool paths only for what needs them: the JSON report, or the category to delete
+        if args.report and not args.categories_only:
+            spool_categories = None
+        elif args.delete_category and not args.categories_only:
+            spool_categories = [args.delete_category]
+        else:
+            spool_categories = []
+        stats = collect_stats(root, top_n=args.top, workers=args.workers,
+                              follow_symlinks=args.follow_symlinks, cache=cache,
+                              large_fetch=args.large_fetch, spool_categories=spool_categories)
+        try:
+            return report_and_clean(args, root, stats, cache)
+        finally:
+            remove_spools(stats)
+    finally:
+        if cache is not None:
+            cache.close()
+
+def report_and_clean(args, root: Path, stats: dict, cache: sqlite3.Connection | None = None) -> int:
     print(f"Scanned: {stats['root']}  |  Total: {stats['total_human']}  |  Generated at: {stats['generated_at']}")
+    if stats["skipped_symlinks"]:
+        print(f"Skipped {stats['skipped_symlinks']} symlinks (use --follow-symlinks to include them)")
     print("\n== Size by category ==")
     for cat, info in stats["by_category_bytes"].items():
         print(f"{cat:>12}: {info['human']}")
@@ -262,15 +879,15 @@ def main():
     # Deletion flows
     if args.delete_category:
         cat = args.delete_category
-        paths = stats["by_category_paths"][cat]
-        if not paths:
+        if not stats["by_category_files"][cat]:
             print(f"No files found for category '{cat}'.")
             return 0
         print(f"\nPreparing deletion for category: {cat}")
-        delete_category(paths, args.min_age_days)
+        delete_category(stats["by_category_spool"][cat], args.min_age_days, args.trash)
 
     if args.delete_ext:
-        delete_by_ext(root, args.delete_ext, args.min_age_days)
+        delete_by_ext(root, args.delete_ext, args.min_age_days, args.workers, args.follow_symlinks, cache,
+                      args.trash, args.large_fetch)
 
     return 0
 
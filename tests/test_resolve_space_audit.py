@@ -0,0 +1,299 @@
+import json
+import os
+
+import pytest
+
+import resolve_space_audit as audit
+
+
+def make_file(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_spool_survives_newlines_and_tabs_in_filenames(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    tricky = make_file(root / "Proxy" / "a\n1\t2\tvictim.txt", 10)
+    victim = make_file(tmp_path / "victim.txt", 5)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(audit, "confirm", lambda prompt: True)
+
+    stats = audit.collect_stats(root)
+    try:
+        entries = list(audit.read_spool(stats["by_category_spool"]["proxy"]))
+        assert [e["path"] for e in entries] == [str(tricky)]
+
+        assert audit.delete_category(stats["by_category_spool"]["proxy"], None) == (1, 10)
+    finally:
+        audit.remove_spools(stats)
+
+    assert not tricky.exists()
+    assert victim.exists()
+
+
+def test_report_streams_category_paths_from_spools(tmp_path):
+    root = tmp_path / "root"
+    clip = make_file(root / "ProxyMedia" / "clip\n.mov", 7)
+    make_file(root / "misc" / "notes.txt", 3)
+    bad = os.path.join(os.fsencode(root / "Gallery"), b"bad\xff.dpx")
+    os.makedirs(os.path.dirname(bad))
+    with open(bad, "wb") as f:
+        f.write(b"x")
+
+    stats = audit.collect_stats(root)
+    try:
+        json_path, _ = audit.write_report(tmp_path / "out" / "report", stats)
+    finally:
+        audit.remove_spools(stats)
+
+    with open(json_path, encoding="utf-8") as f:
+        report = json.load(f)
+    paths = report["by_category_paths"]
+    assert [e["path"] for e in paths["proxy"]] == [str(clip)]
+    assert [e["path"] for e in paths["stills"]] == [os.fsdecode(bad)]
+    assert [e["size"] for e in paths["other"]] == [3]
+    assert "by_category_spool" not in report
+
+
+def test_no_spool_files_unless_requested(tmp_path):
+    root = tmp_path / "root"
+    make_file(root / "Proxy" / "a.mov", 4)
+
+    stats = audit.collect_stats(root, spool_categories=[])
+    assert stats["by_category_spool"] == {}
+    assert stats["by_category_bytes"]["proxy"]["bytes"] == 4
+
+    json_path, _ = audit.write_report(tmp_path / "report", stats)
+    with open(json_path, encoding="utf-8") as f:
+        assert "by_category_paths" not in json.load(f)
+
+
+def cached_stats(root, cache_path, follow_symlinks=False):
+    cache = audit.open_cache(str(cache_path), follow_symlinks)
+    try:
+        return audit.collect_stats(root, follow_symlinks=follow_symlinks, cache=cache, spool_categories=[])
+    finally:
+        cache.close()
+
+
+def test_symlink_does_not_take_over_the_real_folder(tmp_path):
+    root = tmp_path / "root"
+    clip = make_file(root / "Project" / "Proxy" / "a.mov", 5000)
+    (root / "shortcut").symlink_to(root / "Project" / "Proxy")
+    cache_path = tmp_path / "cache.sqlite"
+
+    for stats in (audit.collect_stats(root, follow_symlinks=True),
+                  cached_stats(root, cache_path, follow_symlinks=True),
+                  cached_stats(root, cache_path, follow_symlinks=True)):
+        try:
+            assert stats["by_category_bytes"]["proxy"]["bytes"] == 5000
+            assert stats["by_category_bytes"]["other"]["bytes"] == 0
+            assert [i["path"] for i in stats["largest_files"]] == [str(clip)]
+        finally:
+            audit.remove_spools(stats)
+
+
+CATEGORY_DIRS = {
+    "Backups/Proxy/x": "proxy",
+    "Gallery/Stills": "stills",
+    "Proxy/Backups/CacheClip/deep": "proxy",
+    "Resolve Backups/Optimized Media": "optimized",
+    "OptimizedMedia/Render Cache/PROXIES": "proxy",
+    "GalleryStills/Project Backups": "stills",
+    "media/myproxy/clips": "other",
+    "empty/Proxy/empty/x": "proxy",
+}
+
+
+@pytest.mark.parametrize("root_name", ["root", "Project Backups/root"])
+def test_incremental_category_matches_classify_category(tmp_path, root_name):
+    root = tmp_path / root_name
+    for d in CATEGORY_DIRS:
+        make_file(root / d / "f.mov", 1)
+        (root / d / "sub").mkdir()  # a directory with no files of its own
+    # only reachable through the link, so walked (and classified) under root/linked
+    make_file(tmp_path / "outside" / "Gallery" / "clips" / "f.mov", 1)
+    (root / "linked").symlink_to(tmp_path / "outside")
+    cache_path = tmp_path / "cache.sqlite"
+
+    expected = {str(root / d): cat for d, cat in CATEGORY_DIRS.items()}
+    if root_name != "root":
+        # everything under this root is at least a backup
+        expected = {d: "backups" if cat == "other" else cat for d, cat in expected.items()}
+
+    def categories(**kwargs):
+        stats = audit.collect_stats(root, **kwargs)
+        try:
+            return {os.path.dirname(e["path"]): cat
+                    for cat, spool_path in stats["by_category_spool"].items()
+                    for e in audit.read_spool(spool_path)}
+        finally:
+            audit.remove_spools(stats)
+
+    for follow_symlinks in (False, True):
+        if follow_symlinks:
+            expected[str(root / "linked" / "Gallery" / "clips")] = "stills"
+        for run in range(3):
+            # the first run scans; the others are served from the cache
+            cache = audit.open_cache(str(cache_path), follow_symlinks) if run else None
+            try:
+                got = categories(follow_symlinks=follow_symlinks, cache=cache)
+            finally:
+                if cache is not None:
+                    cache.close()
+            assert got == expected
+            for dirpath, cat in got.items():
+                assert cat == (audit.classify_category(dirpath) or "other"), dirpath
+
+
+def test_cache_relinks_subdir_first_scanned_as_root(tmp_path):
+    root = tmp_path / "a"
+    make_file(root / "top.mov", 500)
+    make_file(root / "b" / "clip.mov", 1000)
+    cache_path = tmp_path / "cache.sqlite"
+
+    assert cached_stats(root / "b", cache_path)["total_bytes"] == 1000
+    assert cached_stats(root, cache_path)["total_bytes"] == 1500
+    # both directories are now served from the cache
+    assert cached_stats(root, cache_path)["total_bytes"] == 1500
+
+
+def test_cache_handles_undecodable_filenames(tmp_path):
+    root = tmp_path / "root"
+    make_file(root / "Proxy" / "ok.mov", 10)
+    bad = os.path.join(os.fsencode(root / "Proxy"), b"bad\xff.mov")
+    with open(bad, "wb") as f:
+        f.write(b"x" * 5)
+    cache_path = tmp_path / "cache.sqlite"
+
+    first = cached_stats(root, cache_path)
+    second = cached_stats(root, cache_path)
+    assert first["total_bytes"] == second["total_bytes"] == 15
+    assert {i["path"] for i in second["largest_files"]} == {str(root / "Proxy" / "ok.mov"), os.fsdecode(bad)}
+
+
+def test_cache_creates_missing_parent_directory(tmp_path):
+    root = tmp_path / "root"
+    make_file(root / "a.mov", 3)
+
+    assert cached_stats(root, tmp_path / "out" / "audit.sqlite")["total_bytes"] == 3
+    assert (tmp_path / "out" / "audit.sqlite").exists()
+
+
+def removal_entries(tmp_path):
+    # three multi-file folders, a single-file one, and one entry that's already gone
+    entries = []
+    for d, count in (("a", 3), ("b", 1), ("c", 5), ("d", 2)):
+        for i in range(count):
+            entries.append({"path": str(make_file(tmp_path / d / f"{i}.mov", i + 1)), "size": i + 1})
+    entries.insert(2, {"path": str(tmp_path / "a" / "missing.mov"), "size": 100})
+    return entries
+
+
+def open_fds():
+    return set(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else set()
+
+
+@pytest.mark.parametrize("unlink_at", [True, False])
+
+
+def test_remove_files_totals_and_failures(tmp_path, monkeypatch, capsys, unlink_at):
+    monkeypatch.setattr(audit, "_UNLINK_AT", audit._UNLINK_AT and unlink_at)
+    # tiny batches and window, so batches and dir fds span directory boundaries
+    monkeypatch.setattr(audit, "DELETE_BATCH", 2)
+    monkeypatch.setattr(audit, "DELETE_WINDOW", 2)
+    entries = removal_entries(tmp_path)
+    fds = open_fds()
+
+    assert audit.remove_files(iter(entries)) == (11, 6 + 1 + 15 + 3)
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 1 and out[0].startswith(f"Failed to delete {tmp_path / 'a' / 'missing.mov'}: ")
+    assert not any(os.listdir(tmp_path / d) for d in "abcd")
+    assert open_fds() == fds
+
+
+def test_trash_counts_only_files_it_moved(tmp_path, monkeypatch):
+    moved = make_file(tmp_path / "moved.mov", 2)
+    stuck = make_file(tmp_path / "stuck.mov", 4)
+    trashed = []
+
+    def fake_send2trash(paths):
+        for path in [paths] if isinstance(paths, str) else paths:
+            if path == str(stuck):
+                raise OSError("locked")
+            os.remove(path)
+            trashed.append(path)
+
+    monkeypatch.setattr(audit, "send2trash", fake_send2trash)
+    entries = [
+        {"path": str(tmp_path / "vanished.mov"), "size": 100},  # gone before we start
+        {"path": str(moved), "size": 2},
+        {"path": str(stuck), "size": 4},
+    ]
+
+    assert audit.trash_files(entries) == (1, 2)
+    assert trashed == [str(moved)]
+    assert stuck.exists()
+
+
+def test_trash_mode_prompt_does_not_say_delete(tmp_path, monkeypatch, capsys):
+    root = tmp_path / "root"
+    make_file(root / "Proxy" / "a.mov", 10)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(audit, "send2trash", lambda paths: None)
+    prompts = []
+    monkeypatch.setattr(audit, "confirm", lambda prompt: prompts.append(prompt) or False)
+
+    stats = audit.collect_stats(root)
+    try:
+        audit.delete_category(stats["by_category_spool"]["proxy"], None, trash=True)
+    finally:
+        audit.remove_spools(stats)
+
+    assert "About to move 1 files to trash" in capsys.readouterr().out
+    assert prompts == ["Proceed with moving them to trash?"]
+
+
+def fake_win_scandir(dirpath):
+    # stands in for FindFirstFileExW: reports each entry's own attributes, as the find data does
+    for entry in os.scandir(dirpath):
+        st = entry.stat(follow_symlinks=False)
+        if entry.is_symlink():
+            attrs, tag = audit._FILE_ATTRIBUTE_REPARSE_POINT, audit._IO_REPARSE_TAG_SYMLINK
+            if os.path.isdir(entry.path):
+                attrs |= audit._FILE_ATTRIBUTE_DIRECTORY
+        elif entry.is_dir(follow_symlinks=False):
+            attrs, tag = audit._FILE_ATTRIBUTE_DIRECTORY, 0
+        else:
+            attrs, tag = 0x20, 0  # FILE_ATTRIBUTE_ARCHIVE
+        yield entry.name, attrs, tag, st.st_size, st.st_mtime
+
+
+def test_win_scan_dir_matches_scan_dir(tmp_path, monkeypatch):
+    make_file(tmp_path / "a.mov", 3)
+    make_file(tmp_path / "sub" / "b.mov", 5)
+    make_file(tmp_path / "other" / "c.mov", 7)
+    (tmp_path / "link_to_file").symlink_to(tmp_path / "other" / "c.mov")
+    (tmp_path / "link_to_dir").symlink_to(tmp_path / "other")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+    monkeypatch.setattr(audit, "_win_scandir", fake_win_scandir)
+
+    def normalized(result):
+        dirpath, files, subdirs, symlinks, complete = result
+        subdirs = sorted((path, st and (st.st_ino, st.st_mtime), is_link) for path, st, is_link in subdirs)
+        return dirpath, sorted(files), subdirs, symlinks, complete
+
+    for follow_symlinks in (False, True):
+        for stat_dirs in (False, True):
+            expected = audit._scan_dir(str(tmp_path), follow_symlinks, stat_dirs)
+            got = audit._scan_dir_win(str(tmp_path), follow_symlinks, stat_dirs)
+            assert normalized(got) == normalized(expected)
+
+
+def test_filetime_converts_to_unix_time():
+    from ctypes import wintypes
+
+    ticks = (1_700_000_000 + 11644473600) * 10_000_000 + 1234567
+    ft = wintypes.FILETIME(ticks & 0xFFFFFFFF, ticks >> 32)
+    assert audit._filetime(ft) == 1_700_000_000 + 0.1234567